@@ -1,5 +1,8 @@
 // import { Article } from "@/data/articles";
-import { fetchArticlesByCat } from "@/data/newsArticles.js";
+import {
+  fetchArticlesByCat,
+  findCachedArticle,
+} from "@/data/newsArticles.js";
 import supabase from "@/lib/supabase";
 
 export interface Article {
@@ -12,12 +15,29 @@ export interface Article {
   image: string;
   url: string;
   source: string;
+  sources?: string[];
   category: string;
   likes: number;
   dislikes: number;
   views: number;
 }
 
+const toArticle = (data): Article => ({
+  id: data.id,
+  title: data.title,
+  summary: data.summary,
+  body: data.body,
+  authors: data.authors,
+  date: data.date,
+  image: data.image,
+  url: data.url,
+  source: data.source,
+  category: data.category,
+  likes: data.likes,
+  dislikes: data.dislikes,
+  views: data.views,
+});
+
 export const getMostViewedArticle = (articles): Article => {
   return articles.reduce((prev, current) =>
     prev.views > current.views ? prev : current
@@ -33,37 +53,65 @@ export const getArticlesByCategory = async (
 export const getArticleById = async (
   id: string
 ): Promise<Article | undefined> => {
-  try {
-    const { data, error } = await supabase
-      .from("articles")
-      .select("*")
-      .eq("id", id)
-      .maybeSingle();
-    if (error) throw error;
-    if (data) {
-      const article: Article = {
-        id: data.id,
-        title: data.title,
-        summary: data.summary,
-        body: data.body,
-        authors: data.authors,
-        date: data.date,
-        image: data.image,
-        url: data.url,
-        source: data.source,
-        category: data.category,
-        likes: data.likes,
-        dislikes: data.dislikes,
-        views: data.views,
-      };
-      return article;
+  const [article] = await getArticlesByIds([id]);
+  return article;
+};
+
+// Looks up many articles at once. Static fields of ids held by the article
+// cache are answered locally, with only their counters re-read (cached
+// counts can be over an hour old); the remaining ids are fetched in full.
+// Both queries run in parallel, one `in` filter each.
+export const getArticlesByIds = async (ids: string[]): Promise<Article[]> => {
+  const found = new Map<string, Article>();
+  const cachedIds: string[] = [];
+  const missingIds: string[] = [];
+  for (const id of ids) {
+    const cached = findCachedArticle(id);
+    if (cached) {
+      found.set(String(id), cached);
+      cachedIds.push(id);
     } else {
-      return undefined;
+      missingIds.push(id);
+    }
+  }
+
+  const [counters, rows] = await Promise.all([
+    cachedIds.length > 0
+      ? supabase
+          .from("articles")
+          .select("id, views, likes, dislikes")
+          .in("id", cachedIds)
+      : { data: [], error: null },
+    missingIds.length > 0
+      ? supabase.from("articles").select("*").in("id", missingIds)
+      : { data: [], error: null },
+  ]);
+
+  if (counters.error) {
+    console.error("Error fetching article counters:", counters.error.message);
+  } else {
+    for (const row of counters.data) {
+      found.set(String(row.id), {
+        ...found.get(String(row.id)),
+        views: row.views,
+        likes: row.likes,
+        dislikes: row.dislikes,
+      });
     }
-  } catch (error) {
-    console.error("Error fetching article:", error.message);
-    return undefined;
   }
+
+  if (rows.error) {
+    console.error("Error fetching articles:", rows.error.message);
+  } else {
+    for (const row of rows.data) {
+      found.set(String(row.id), toArticle(row));
+    }
+  }
+
+  // Keys are stringified so numeric ids from the database still match.
+  return ids
+    .filter((id) => found.has(String(id)))
+    .map((id) => found.get(String(id)));
 };
 
 export const updateArticle = async (
@@ -85,3 +133,219 @@ export const updateArticle = async (
     console.error("Error updating article:", error.message);
   }
 };
+
+export type ArticleCounter = "views" | "likes" | "dislikes";
+
+type CounterDeltas = Record<ArticleCounter, number>;
+
+// Counter changes are summed per article in memory and written back at most
+// once per article every COUNTER_FLUSH_INTERVAL, instead of one UPDATE per
+// click or view. Each flush re-reads the stored counts and writes the new
+// totals with a conditional update that only matches if the counts are
+// unchanged; if another client wrote in between, nothing matches and the
+// deltas are re-queued. Failed articles are retried with a doubling delay
+// and given up (and logged) after MAX_COUNTER_ATTEMPTS, so a write that can
+// never match (e.g. filtered by row-level security) does not loop forever.
+const COUNTER_FLUSH_INTERVAL = 5000;
+const MAX_COUNTER_ATTEMPTS = 5;
+const COUNTERS: ArticleCounter[] = ["views", "likes", "dislikes"];
+const PENDING_COUNTERS_KEY = "techdigest:pendingCounters";
+
+const pendingCounters = new Map<string, CounterDeltas>();
+// Deltas taken by a flush that has not confirmed its write yet.
+const flushingCounters = new Map<string, CounterDeltas>();
+// Failed flush attempts per article, cleared once a write succeeds.
+const counterAttempts = new Map<string, number>();
+let counterFlushTimer: ReturnType<typeof setTimeout> | undefined;
+
+const addPendingDeltas = (articleId: string, deltas: CounterDeltas) => {
+  const pending = pendingCounters.get(articleId) ?? {
+    views: 0,
+    likes: 0,
+    dislikes: 0,
+  };
+  for (const counter of COUNTERS) {
+    pending[counter] += deltas[counter];
+  }
+  pendingCounters.set(articleId, pending);
+};
+
+const scheduleCounterFlush = (delay = COUNTER_FLUSH_INTERVAL) => {
+  if (counterFlushTimer === undefined) {
+    counterFlushTimer = setTimeout(flushArticleCounters, delay);
+  }
+};
+
+const retryPendingDeltas = (articleId: string, deltas: CounterDeltas) => {
+  const attempts = (counterAttempts.get(articleId) ?? 0) + 1;
+  if (attempts >= MAX_COUNTER_ATTEMPTS) {
+    console.error(
+      `Giving up on article ${articleId} counters after ${attempts} attempts:`,
+      deltas
+    );
+    counterAttempts.delete(articleId);
+    return;
+  }
+  counterAttempts.set(articleId, attempts);
+  addPendingDeltas(articleId, deltas);
+};
+
+export const incrementArticleCounter = (
+  articleId: string,
+  counter: ArticleCounter,
+  delta = 1
+): void => {
+  addPendingDeltas(articleId, {
+    views: 0,
+    likes: 0,
+    dislikes: 0,
+    [counter]: delta,
+  });
+  scheduleCounterFlush();
+};
+
+export const getPendingCounterDelta = (
+  articleId: string,
+  counter: ArticleCounter
+): number => {
+  return (
+    (pendingCounters.get(articleId)?.[counter] ?? 0) +
+    (flushingCounters.get(articleId)?.[counter] ?? 0)
+  );
+};
+
+export const flushArticleCounters = async (): Promise<void> => {
+  clearTimeout(counterFlushTimer);
+  counterFlushTimer = undefined;
+
+  const batch = Array.from(pendingCounters);
+  pendingCounters.clear();
+  if (batch.length === 0) return;
+  for (const [articleId, deltas] of batch) {
+    flushingCounters.set(articleId, deltas);
+  }
+
+  try {
+    const { data, error } = await supabase
+      .from("articles")
+      .select("id, views, likes, dislikes")
+      .in(
+        "id",
+        batch.map(([articleId]) => articleId)
+      );
+    if (error) throw error;
+
+    // Ids can come back as numbers while route params are strings.
+    const stored = new Map(data.map((row) => [String(row.id), row]));
+    await Promise.all(
+      batch.map(async ([articleId, deltas]) => {
+        const row = stored.get(String(articleId));
+        if (!row) {
+          flushingCounters.delete(articleId);
+          counterAttempts.delete(articleId);
+          console.error(`Article ${articleId} not found; dropping counters:`, deltas);
+          return;
+        }
+
+        const update: Partial<CounterDeltas> = {};
+        for (const counter of COUNTERS) {
+          if (deltas[counter] !== 0) {
+            update[counter] = Math.max(0, (row[counter] || 0) + deltas[counter]);
+          }
+        }
+
+        let query = supabase.from("articles").update(update).eq("id", articleId);
+        for (const counter of Object.keys(update)) {
+          query =
+            row[counter] === null
+              ? query.is(counter, null)
+              : query.eq(counter, row[counter]);
+        }
+
+        const { data: written, error } = await query.select("id");
+        // Deltas saved by savePendingCounters meanwhile are retried from
+        // storage instead, so only re-queue the ones this flush still owns.
+        const owned = flushingCounters.delete(articleId);
+        if (!owned) return;
+        if (error || written.length === 0) {
+          retryPendingDeltas(articleId, deltas);
+        } else {
+          counterAttempts.delete(articleId);
+        }
+      })
+    );
+  } catch (error) {
+    console.error("Error flushing article counters:", error.message);
+    for (const [articleId, deltas] of batch) {
+      if (flushingCounters.delete(articleId)) {
+        retryPendingDeltas(articleId, deltas);
+      }
+    }
+  }
+
+  if (pendingCounters.size > 0) {
+    const attempts = Math.max(
+      0,
+      ...Array.from(pendingCounters.keys(), (id) => counterAttempts.get(id) ?? 0)
+    );
+    scheduleCounterFlush(COUNTER_FLUSH_INTERVAL * 2 ** attempts);
+  }
+};
+
+// A flush needs two round trips, which the browser will not finish once the
+// page is unloading. Deltas that are pending, or taken by a flush that has
+// not confirmed its write, are saved to localStorage instead and flushed by
+// the next page load. A write that landed just before unload may therefore
+// be applied twice, but none are lost with the page.
+const savePendingCounters = () => {
+  const unsaved = [...flushingCounters, ...pendingCounters].map(
+    ([articleId, deltas]) => [articleId, deltas, counterAttempts.get(articleId) ?? 0]
+  );
+  if (unsaved.length === 0) return;
+  try {
+    const saved = JSON.parse(localStorage.getItem(PENDING_COUNTERS_KEY) || "[]");
+    localStorage.setItem(
+      PENDING_COUNTERS_KEY,
+      JSON.stringify([...saved, ...unsaved])
+    );
+    flushingCounters.clear();
+    pendingCounters.clear();
+  } catch (error) {
+    // Storage unavailable; the pending deltas are lost with the page.
+  }
+};
+
+const restorePendingCounters = () => {
+  try {
+    const saved = JSON.parse(localStorage.getItem(PENDING_COUNTERS_KEY) || "[]");
+    localStorage.removeItem(PENDING_COUNTERS_KEY);
+    for (const [articleId, deltas, attempts = 0] of saved) {
+      addPendingDeltas(articleId, deltas);
+      if (attempts > (counterAttempts.get(articleId) ?? 0)) {
+        counterAttempts.set(articleId, attempts);
+      }
+    }
+  } catch (error) {
+    // Ignore unreadable saved counters.
+  }
+  if (pendingCounters.size > 0) {
+    scheduleCounterFlush();
+  }
+};
+
+if (typeof window !== "undefined") {
+  restorePendingCounters();
+  window.addEventListener("pagehide", savePendingCounters);
+  // Pages restored from the back/forward cache pick their saved deltas back up.
+  window.addEventListener("pageshow", (event) => {
+    if (event.persisted) {
+      restorePendingCounters();
+    }
+  });
+  // A hidden tab usually stays alive long enough to finish a flush.
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") {
+      flushArticleCounters();
+    }
+  });
+}
@@ -1,48 +1,390 @@
 import axios from 'axios';
 import supabase from '../lib/supabase';
+import { DuplicateIndex, clusterDuplicates, computeSignatures, fnv1a } from '../lib/dedupe';
 
 const API_URL = 'https://tiger-diegest-40937983b1dd.herokuapp.com';
 
+// Requests are not serialised or capped: they start immediately as long as
+// the token bucket has tokens. The bucket allows bursts of RATE_LIMIT_BURST
+// (every endpoint plus ArticlePage's parallel category loads at once) and
+// refills at RATE_LIMIT_PER_SECOND, so a retry storm cannot flood the API.
+// Failed requests are retried with exponential backoff.
+const RATE_LIMIT_BURST = 20;
+const RATE_LIMIT_PER_SECOND = 10;
+const MAX_RETRIES = 3;
+const RETRY_BASE_DELAY = 500;
+
+const api = axios.create({ baseURL: API_URL, timeout: 15000 });
+
+// Point the article API at another server, e.g. a local replay server in
+// benchmarks.
+export const setArticlesApiUrl = (url = API_URL) => {
+    api.defaults.baseURL = url;
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+let rateLimitTokens = RATE_LIMIT_BURST;
+let lastTokenRefill = Date.now();
+
+async function takeRateLimitToken() {
+    for (;;) {
+        const now = Date.now();
+        rateLimitTokens = Math.min(
+            RATE_LIMIT_BURST,
+            rateLimitTokens + ((now - lastTokenRefill) * RATE_LIMIT_PER_SECOND) / 1000,
+        );
+        lastTokenRefill = now;
+        if (rateLimitTokens >= 1) {
+            rateLimitTokens -= 1;
+            return;
+        }
+        await sleep(((1 - rateLimitTokens) * 1000) / RATE_LIMIT_PER_SECOND);
+    }
+}
+
+// Per-endpoint request metrics. Latencies keep the most recent
+// MAX_LATENCY_SAMPLES so percentiles reflect current behaviour.
+const MAX_LATENCY_SAMPLES = 200;
+const requestMetrics = new Map();
+const textEncoder = new TextEncoder();
+
+function getEndpointMetrics(path) {
+    if (!requestMetrics.has(path)) {
+        requestMetrics.set(path, {
+            requests: 0,
+            errors: 0,
+            retries: 0,
+            rateLimitWaitMs: 0,
+            retryWaitMs: 0,
+            payloadBytes: 0,
+            parseMs: 0,
+            parseErrors: 0,
+            latencies: [],
+        });
+    }
+    return requestMetrics.get(path);
+}
+
+function recordLatency(metrics, ms) {
+    metrics.latencies.push(ms);
+    if (metrics.latencies.length > MAX_LATENCY_SAMPLES) {
+        metrics.latencies.shift();
+    }
+}
+
+function percentile(sorted, p) {
+    if (sorted.length === 0) return 0;
+    return sorted[Math.min(sorted.length - 1, Math.floor((sorted.length * p) / 100))];
+}
+
+export const getRequestMetrics = () => {
+    const snapshot = {};
+    for (const [path, { latencies, ...totals }] of requestMetrics) {
+        const sorted = [...latencies].sort((a, b) => a - b);
+        snapshot[path] = {
+            ...totals,
+            p50Ms: percentile(sorted, 50),
+            p99Ms: percentile(sorted, 99),
+        };
+    }
+    return snapshot;
+};
+
+async function getWithRetry(path) {
+    const metrics = getEndpointMetrics(path);
+    for (let attempt = 0; ; attempt++) {
+        const waitStart = performance.now();
+        await takeRateLimitToken();
+        const requestStart = performance.now();
+        metrics.rateLimitWaitMs += requestStart - waitStart;
+        metrics.requests++;
+        try {
+            // Parse the body ourselves so decode time can be measured.
+            const response = await api.get(path, {
+                responseType: 'text',
+                transformResponse: (body) => body,
+            });
+            const parseStart = performance.now();
+            const body = response.data;
+            try {
+                response.data = body ? JSON.parse(body) : body;
+            } catch (error) {
+                // Like axios' default transform, keep a non-JSON body as
+                // text; retrying would only fetch the same body again.
+                metrics.parseErrors++;
+            }
+            metrics.parseMs += performance.now() - parseStart;
+            // Content-Length counts bytes on the wire (compressed, if the
+            // server compressed the body); without it, encode the text.
+            const contentLength = Number(response.headers?.['content-length']);
+            metrics.payloadBytes += contentLength > 0
+                ? contentLength
+                : body ? textEncoder.encode(body).length : 0;
+            recordLatency(metrics, performance.now() - requestStart);
+            return response;
+        } catch (error) {
+            metrics.errors++;
+            const status = error.response?.status;
+            const retryable = !status || status === 429 || status >= 500;
+            if (!retryable || attempt >= MAX_RETRIES) throw error;
+        }
+        const delay = RETRY_BASE_DELAY * 2 ** attempt;
+        metrics.retries++;
+        metrics.retryWaitMs += delay;
+        await sleep(delay);
+    }
+}
+
+// Content hashes of the rows last written, so an ingestion batch only sends
+// articles that are new or changed. Unchanged rows are answered from the
+// article index, with their counters re-read since the hash only covers the
+// upstream payload.
+const upsertedHashes = new Map();
+
+function contentHash(article) {
+    return fnv1a(JSON.stringify(article));
+}
+
+async function selectCounters(ids) {
+    const counters = new Map();
+    if (ids.length === 0) return counters;
+
+    const { data, error } = await supabase
+        .from('articles')
+        .select('id, views, likes, dislikes')
+        .in('id', ids);
+
+    if (error) {
+        console.error('Error fetching article counters:', error.message);
+        return counters;
+    }
+    for (const row of data) {
+        counters.set(String(row.id), { views: row.views, likes: row.likes, dislikes: row.dislikes });
+    }
+    return counters;
+}
+
+// Upstream ids may be numbers while stored rows and route params are
+// strings, so ids are indexed and looked up in string form.
+function findIndexed(idOrUrl) {
+    return articleIndex.get(String(idOrUrl));
+}
+
+function withCounters(article, counters) {
+    const current = counters.get(String(article.id));
+    return current ? { ...article, ...current } : article;
+}
+
+// Throws if the upsert fails, so the caller can drop the whole batch rather
+// than cache a partial list.
 async function upsertToArticleTable(articles) {
+    const changed = [];
+    const skipped = new Set();
+    const seenIds = new Set();
+    const hashes = new Map();
+    for (const article of articles) {
+        if (article.id === undefined || article.id === null) {
+            changed.push(article);
+            continue;
+        }
+        // One bulk upsert cannot touch the same row twice, so a repeated
+        // id keeps only its first (highest ranked) occurrence.
+        const key = String(article.id);
+        if (seenIds.has(key)) continue;
+        seenIds.add(key);
+
+        const hash = contentHash(article);
+        hashes.set(key, hash);
+        if (findIndexed(article.id) && upsertedHashes.get(key) === hash) {
+            skipped.add(key);
+        } else {
+            changed.push(article);
+        }
+    }
+
+    const [upserted, counters] = await Promise.all([
+        changed.length > 0
+            ? supabase.from('articles').upsert(changed).select()
+            : { data: [], error: null },
+        selectCounters(articles.filter((article) => skipped.has(String(article.id))).map((article) => article.id)),
+    ]);
+
+    if (upserted.error) throw new Error(upserted.error.message);
+
+    const rowsById = new Map(upserted.data.map((row) => [String(row.id), row]));
+    for (const key of rowsById.keys()) {
+        if (!hashes.has(key)) continue;
+        upsertedHashes.delete(key);
+        upsertedHashes.set(key, hashes.get(key));
+    }
+    while (upsertedHashes.size > MAX_INDEXED_ARTICLES) {
+        upsertedHashes.delete(upsertedHashes.keys().next().value);
+    }
+
+    const results = [];
+    const returned = new Set();
+    for (const article of articles) {
+        const key = String(article.id);
+        if (article.id === undefined || article.id === null || returned.has(key)) continue;
+        const row = skipped.has(key)
+            ? withCounters(findIndexed(article.id), counters)
+            : rowsById.get(key);
+        if (row) {
+            results.push(row);
+            returned.add(key);
+        }
+    }
+    // Rows for inputs without a usable id are returned as selected.
+    for (const row of upserted.data) {
+        if (!returned.has(String(row.id))) {
+            results.push(row);
+            returned.add(String(row.id));
+        }
+    }
+    return results;
+}
+
+// Article lists are cached in memory per endpoint. Fresh entries are served
+// directly; expired entries are still served while a single background
+// refresh runs, until they are older than MAX_STALE_AGE. Concurrent loads of
+// the same endpoint share one request and upsert.
+const TRENDING_TTL = 5 * 60 * 1000;
+const CATEGORY_TTL = 15 * 60 * 1000;
+const MAX_STALE_AGE = 60 * 60 * 1000;
+const MAX_CACHE_ENTRIES = 32;
+
+// Cached lists are also persisted to localStorage as versioned snapshots so a
+// page reload can render immediately and revalidate in the background. Bump
+// SNAPSHOT_VERSION whenever the stored article shape changes.
+const SNAPSHOT_VERSION = 2;
+const SNAPSHOT_FAMILY = 'techdigest:articles:';
+const SNAPSHOT_PREFIX = `${SNAPSHOT_FAMILY}v${SNAPSHOT_VERSION}:`;
+const snapshotStorage = typeof window !== 'undefined' ? window.localStorage : undefined;
+
+// Every cached article is also indexed by id and URL so deep links can be
+// resolved without scanning category lists or calling the API.
+const MAX_INDEXED_ARTICLES = 2000;
+
+const articleCache = new Map();
+const articleIndex = new Map();
+const cacheStats = { hits: 0, misses: 0, expired: 0 };
+const inFlightLoads = new Map();
+
+function normalizeArticle(article) {
+    return {
+        id: article.id,
+        title: article.title,
+        summary: article.summary,
+        body: article.body,
+        authors: article.authors,
+        date: article.date,
+        image: article.image,
+        url: article.url,
+        source: article.source,
+        category: article.category,
+        likes: article.likes ?? 0,
+        dislikes: article.dislikes ?? 0,
+        views: article.views ?? 0,
+        sources: article.sources ?? (article.source ? [article.source] : []),
+    };
+}
+
+function indexArticles(articles) {
+    for (const article of articles) {
+        for (const value of [article.id, article.url]) {
+            if (value === undefined || value === null || value === '') continue;
+            const key = String(value);
+            articleIndex.delete(key);
+            articleIndex.set(key, article);
+        }
+    }
+    while (articleIndex.size > MAX_INDEXED_ARTICLES) {
+        articleIndex.delete(articleIndex.keys().next().value);
+    }
+}
+
+// Drop snapshots written under an older SNAPSHOT_VERSION; they can never be
+// read again and would otherwise hold storage quota forever.
+function removeOutdatedSnapshots() {
     try {
-        const upsertPromises = articles.map(async (article) => {
-            const { data, error } = await supabase
-                .from('articles')
-                .upsert(article)
-                .select();
-
-            if (error) throw new Error(error.message);
-            return data[0];
-        });
+        for (let i = snapshotStorage.length - 1; i >= 0; i--) {
+            const key = snapshotStorage.key(i);
+            if (key?.startsWith(SNAPSHOT_FAMILY) && !key.startsWith(SNAPSHOT_PREFIX)) {
+                snapshotStorage.removeItem(key);
+            }
+        }
+    } catch (error) {
+        // Ignore storage errors.
+    }
+}
 
-        const results = await Promise.all(upsertPromises);
+if (snapshotStorage) {
+    removeOutdatedSnapshots();
+}
 
-        return results;
+function readSnapshot(path) {
+    try {
+        const stored = snapshotStorage?.getItem(SNAPSHOT_PREFIX + path);
+        return stored ? JSON.parse(stored) : undefined;
     } catch (error) {
+        return undefined;
+    }
+}
 
-        return [];
+function writeSnapshot(path, entry) {
+    try {
+        snapshotStorage?.setItem(SNAPSHOT_PREFIX + path, JSON.stringify(entry));
+    } catch (error) {
+        // Storage full or unavailable; the in-memory cache still works.
     }
 }
 
-export const fetchArticles = async () => {
+function removeSnapshot(path) {
     try {
-        const response = await axios.get(`${API_URL}/api/articles/trending`);
-        if (response.status === 200) {
-            return await upsertToArticleTable(response.data);
-        }
-        console.error('Error fetching articles:', response.status);
-        return [];
+        snapshotStorage?.removeItem(SNAPSHOT_PREFIX + path);
     } catch (error) {
-        console.error('Error fetching articles:', error);
-        return [];
+        // Ignore storage errors.
     }
-};
+}
 
-export const fetchArticlesByCat = async (category) => {
+function getCachedArticles(path) {
+    let entry = articleCache.get(path);
+    if (!entry) {
+        entry = readSnapshot(path);
+        if (entry) {
+            articleCache.set(path, entry);
+            indexArticles(entry.articles);
+        }
+    } else {
+        // Re-insert so Map order tracks recency for LRU eviction.
+        articleCache.delete(path);
+        articleCache.set(path, entry);
+    }
+    return entry;
+}
+
+function setCachedArticles(path, articles, ttl) {
+    const entry = {
+        articles: articles.map(normalizeArticle),
+        expiresAt: Date.now() + ttl,
+    };
+    articleCache.delete(path);
+    articleCache.set(path, entry);
+    writeSnapshot(path, entry);
+    indexArticles(entry.articles);
+    while (articleCache.size > MAX_CACHE_ENTRIES) {
+        const oldest = articleCache.keys().next().value;
+        articleCache.delete(oldest);
+        removeSnapshot(oldest);
+    }
+}
+
+async function requestArticles(path) {
     try {
-        const response = await axios.get(`${API_URL}/api/articles/${category}`);
-        if (response.status === 200) {
-            return await upsertToArticleTable(response.data);
+        const response = await getWithRetry(path);
+        if (response.status === 200 && Array.isArray(response.data)) {
+            return await upsertDeduplicated(response.data);
         }
         console.error('Error fetching articles:', response.status);
         return [];
@@ -50,17 +392,173 @@ export const fetchArticlesByCat = async (category) => {
         console.error('Error fetching articles:', error);
         return [];
     }
-};
+}
 
-let cachedArticles = [];
+// Syndicated copies of the same story are collapsed to the first (highest
+// ranked) article before anything is stored; the others only contribute
+// their source names. duplicateIndex remembers canonical articles across
+// batches, so a story already stored under another endpoint maps to that
+// article instead of being stored again.
+const duplicateIndex = new DuplicateIndex(MAX_INDEXED_ARTICLES);
+let dedupeQueue = Promise.resolve();
 
-// The issue is here - incorrect export syntax
-export const initializeArticles = async () => {
-    if (cachedArticles.length === 0) {
-        cachedArticles = await fetchArticles();
+function uniqueSources(articles) {
+    return [...new Set(articles.map((article) => article.source).filter(Boolean))];
+}
+
+// Batches are deduplicated one at a time so concurrent loads of different
+// endpoints see each other's canonical articles.
+function upsertDeduplicated(articles) {
+    const run = dedupeQueue.then(() => dedupeAndUpsert(articles));
+    dedupeQueue = run.catch(() => {});
+    return run;
+}
+
+async function dedupeAndUpsert(articles) {
+    const clusters = clusterDuplicates(articles);
+    const canonical = clusters.map(([first]) => articles[first]);
+    const clusterSources = clusters.map((cluster) => uniqueSources(cluster.map((index) => articles[index])));
+    const signatures = computeSignatures(canonical);
+
+    // A match on the article's own id is a refresh of the same story, which
+    // still goes through the upsert so upstream edits are written.
+    const slots = canonical.map((article, i) => duplicateIndex.find(signatures, i, article.url));
+    const isDuplicate = canonical.map((article, i) => (
+        slots[i] !== -1 && String(duplicateIndex.item(slots[i]).id) !== String(article.id)
+    ));
+
+    // Counters of canonical articles stored earlier are re-read alongside.
+    const [stored, counters] = await Promise.all([
+        upsertToArticleTable(canonical.filter((_, i) => !isDuplicate[i])),
+        selectCounters(slots.filter((_, i) => isDuplicate[i]).map((slot) => duplicateIndex.item(slot).id)),
+    ]);
+    const storedById = new Map(stored.map((row) => [String(row.id), row]));
+    const unmatched = new Set(stored);
+
+    // Matched slots are read and refreshed before any new article is added,
+    // since add() may evict a slot that another article in this batch matched.
+    const entries = new Array(canonical.length);
+    const settle = (i, slot) => {
+        duplicateIndex.addSources(slot, clusterSources[i]);
+        const item = isDuplicate[i]
+            ? withCounters(duplicateIndex.item(slot), counters)
+            : duplicateIndex.item(slot);
+        entries[i] = { ...item, sources: duplicateIndex.sourcesOf(slot) };
+    };
+    const rowFor = (article) => {
+        const row = storedById.get(String(article.id));
+        unmatched.delete(row);
+        return row;
+    };
+    canonical.forEach((article, i) => {
+        if (slots[i] === -1) return;
+        if (!isDuplicate[i]) {
+            const row = rowFor(article);
+            if (!row) return;
+            duplicateIndex.replaceItem(slots[i], row);
+        }
+        settle(i, slots[i]);
+    });
+    canonical.forEach((article, i) => {
+        if (slots[i] !== -1) return;
+        const row = rowFor(article);
+        if (!row) return;
+        settle(i, duplicateIndex.add(signatures, i, article.url, row, clusterSources[i]));
+    });
+
+    // Entries sharing a slot keep the first position and the latest sources.
+    const results = new Map();
+    for (const entry of entries) {
+        if (entry) {
+            results.set(String(entry.id), entry);
+        }
+    }
+    // Rows that could not be matched back to an input id are returned as-is.
+    return [...results.values(), ...unmatched];
+}
+
+function refreshArticles(path, ttl) {
+    if (!inFlightLoads.has(path)) {
+        const load = requestArticles(path)
+            .then((articles) => {
+                if (articles.length === 0) {
+                    return articles;
+                }
+                setCachedArticles(path, articles, ttl);
+                return articleCache.get(path).articles;
+            })
+            .finally(() => inFlightLoads.delete(path));
+        inFlightLoads.set(path, load);
+    }
+    return inFlightLoads.get(path);
+}
+
+async function loadArticles(path, ttl) {
+    const entry = getCachedArticles(path);
+    const now = Date.now();
+
+    if (!entry || now - entry.expiresAt > MAX_STALE_AGE) {
+        cacheStats.misses++;
+        return refreshArticles(path, ttl);
     }
-    return cachedArticles;
+    if (entry.expiresAt <= now) {
+        cacheStats.expired++;
+        refreshArticles(path, ttl);
+    } else {
+        cacheStats.hits++;
+    }
+    return entry.articles;
+}
+
+export const getCacheStats = () => ({ ...cacheStats, size: articleCache.size });
+
+const REQUEST_METRICS = [
+    ['requests', 'requests_total', 'counter'],
+    ['errors', 'request_errors_total', 'counter'],
+    ['retries', 'request_retries_total', 'counter'],
+    ['rateLimitWaitMs', 'rate_limit_wait_ms_total', 'counter'],
+    ['retryWaitMs', 'retry_wait_ms_total', 'counter'],
+    ['payloadBytes', 'payload_bytes_total', 'counter'],
+    ['parseMs', 'parse_ms_total', 'counter'],
+    ['parseErrors', 'parse_errors_total', 'counter'],
+    ['p50Ms', 'request_latency_p50_ms', 'gauge'],
+    ['p99Ms', 'request_latency_p99_ms', 'gauge'],
+];
+
+// Request and cache metrics in the Prometheus text format, for logging or
+// diffing between runs.
+export const formatMetrics = () => {
+    const lines = [];
+    const metric = (name, type, samples) => {
+        lines.push(`# TYPE techdigest_${name} ${type}`);
+        for (const [labels, value] of samples) {
+            lines.push(`techdigest_${name}${labels} ${Number(value.toFixed(3))}`);
+        }
+    };
+
+    const endpoints = Object.entries(getRequestMetrics());
+    for (const [field, name, type] of REQUEST_METRICS) {
+        // JSON string escaping matches Prometheus label value escaping.
+        metric(name, type, endpoints.map(([path, metrics]) => [`{endpoint=${JSON.stringify(path)}}`, metrics[field]]));
+    }
+    const cache = getCacheStats();
+    metric('cache_hits_total', 'counter', [['', cache.hits]]);
+    metric('cache_misses_total', 'counter', [['', cache.misses]]);
+    metric('cache_expired_total', 'counter', [['', cache.expired]]);
+    metric('cache_entries', 'gauge', [['', cache.size]]);
+    return `${lines.join('\n')}\n`;
 };
 
-// This is the articles export that's being awaited in articles.js
-export const articles = fetchArticles();
\ No newline at end of file
+export const findCachedArticle = (idOrUrl) => findIndexed(idOrUrl);
+
+export const fetchArticles = async () => {
+    return loadArticles('/api/articles/trending', TRENDING_TTL);
+};
+
+export const fetchArticlesByCat = async (category) => {
+    return loadArticles(`/api/articles/${category}`, CATEGORY_TTL);
+};
+
+export const initializeArticles = async () => {
+    return fetchArticles();
+};
\ No newline at end of file
@@ -0,0 +1,304 @@
+// Near-duplicate detection for article batches.
+//
+// Each article is reduced to a MinHash signature over word shingles of its
+// title and opening text. Signatures are split into LSH bands; only articles
+// sharing a band become candidate pairs, so a batch is clustered without
+// comparing every pair. Candidates whose signatures agree on at least
+// SIMILARITY_THRESHOLD of their hashes (an estimate of Jaccard similarity) are
+// merged, as are articles with the same URL.
+//
+// clusterDuplicates works within one batch; DuplicateIndex keeps signatures
+// across batches so a story already ingested elsewhere is recognised.
+
+interface DedupeInput {
+  title?: string;
+  body?: string;
+  url?: string;
+}
+
+const NUM_HASHES = 32;
+const BANDS = 8;
+const ROWS_PER_BAND = NUM_HASHES / BANDS;
+const SHINGLE_SIZE = 3;
+const TEXT_LENGTH = 500;
+const SIMILARITY_THRESHOLD = 0.7;
+// Bounds work on very crowded buckets: a new article is only checked
+// against the most recent members of each bucket it lands in.
+const MAX_BUCKET_SCAN = 16;
+
+const EMPTY = 0xffffffff;
+
+const SEEDS = Uint32Array.from({ length: NUM_HASHES }, (_, i) =>
+  Math.imul(i + 1, 0x9e3779b1)
+);
+
+export const fnv1a = (text: string): number => {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < text.length; i++) {
+    hash ^= text.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+};
+
+// Murmur3 finaliser: turns one shingle hash into an independent hash per seed.
+const mix = (hash: number, seed: number): number => {
+  let h = (hash ^ seed) >>> 0;
+  h = Math.imul(h ^ (h >>> 16), 0x85ebca6b);
+  h = Math.imul(h ^ (h >>> 13), 0xc2b2ae35);
+  return (h ^ (h >>> 16)) >>> 0;
+};
+
+const shingles = (article: DedupeInput): number[] => {
+  const text = `${article.title || ""} ${(article.body || "").slice(
+    0,
+    TEXT_LENGTH
+  )}`;
+  const words = text.toLowerCase().match(/[a-z0-9]+/g) || [];
+  if (words.length < SHINGLE_SIZE) {
+    return words.length > 0 ? [fnv1a(words.join(" "))] : [];
+  }
+  const hashes = new Set<number>();
+  for (let i = 0; i + SHINGLE_SIZE <= words.length; i++) {
+    hashes.add(fnv1a(words.slice(i, i + SHINGLE_SIZE).join(" ")));
+  }
+  return Array.from(hashes);
+};
+
+// All signatures live in one flat array: article i owns
+// signatures[i * NUM_HASHES .. (i + 1) * NUM_HASHES).
+export const computeSignatures = (articles: DedupeInput[]): Uint32Array => {
+  const signatures = new Uint32Array(articles.length * NUM_HASHES).fill(EMPTY);
+  articles.forEach((article, i) => {
+    const offset = i * NUM_HASHES;
+    for (const hash of shingles(article)) {
+      for (let k = 0; k < NUM_HASHES; k++) {
+        const value = mix(hash, SEEDS[k]);
+        if (value < signatures[offset + k]) {
+          signatures[offset + k] = value;
+        }
+      }
+    }
+  });
+  return signatures;
+};
+
+const similarity = (
+  a: Uint32Array,
+  aIndex: number,
+  b: Uint32Array,
+  bIndex: number
+): number => {
+  let matches = 0;
+  for (let k = 0; k < NUM_HASHES; k++) {
+    if (a[aIndex * NUM_HASHES + k] === b[bIndex * NUM_HASHES + k]) {
+      matches++;
+    }
+  }
+  return matches / NUM_HASHES;
+};
+
+const bandKey = (signatures: Uint32Array, i: number, band: number): string => {
+  const start = i * NUM_HASHES + band * ROWS_PER_BAND;
+  return `${band}:${signatures.subarray(start, start + ROWS_PER_BAND).join(",")}`;
+};
+
+// Groups near-duplicate articles. Returns clusters of indexes into
+// `articles`, each in input order, ordered by their first member.
+export function clusterDuplicates(articles: DedupeInput[]): number[][] {
+  const parent = Int32Array.from({ length: articles.length }, (_, i) => i);
+  const find = (i: number): number => {
+    while (parent[i] !== i) {
+      parent[i] = parent[parent[i]];
+      i = parent[i];
+    }
+    return i;
+  };
+  const union = (a: number, b: number) => {
+    const rootA = find(a);
+    const rootB = find(b);
+    if (rootA !== rootB) {
+      parent[Math.max(rootA, rootB)] = Math.min(rootA, rootB);
+    }
+  };
+
+  const byUrl = new Map<string, number>();
+  articles.forEach((article, i) => {
+    if (!article.url) return;
+    const first = byUrl.get(article.url);
+    if (first === undefined) {
+      byUrl.set(article.url, i);
+    } else {
+      union(first, i);
+    }
+  });
+
+  const signatures = computeSignatures(articles);
+  for (let band = 0; band < BANDS; band++) {
+    const buckets = new Map<string, number[]>();
+    for (let i = 0; i < articles.length; i++) {
+      // Articles without any text keep the all-ones signature; skip them.
+      if (signatures[i * NUM_HASHES] === EMPTY) continue;
+      const key = bandKey(signatures, i, band);
+      const bucket = buckets.get(key);
+      if (!bucket) {
+        buckets.set(key, [i]);
+        continue;
+      }
+      for (
+        let b = Math.max(0, bucket.length - MAX_BUCKET_SCAN);
+        b < bucket.length;
+        b++
+      ) {
+        const j = bucket[b];
+        if (
+          find(j) !== find(i) &&
+          similarity(signatures, j, signatures, i) >= SIMILARITY_THRESHOLD
+        ) {
+          union(j, i);
+        }
+      }
+      bucket.push(i);
+    }
+  }
+
+  const clusters = new Map<number, number[]>();
+  for (let i = 0; i < articles.length; i++) {
+    const root = find(i);
+    if (!clusters.has(root)) {
+      clusters.set(root, []);
+    }
+    clusters.get(root).push(i);
+  }
+  return Array.from(clusters.values());
+}
+
+// A bounded, incrementally updated store of canonical articles. Signatures
+// live in one flat Uint32Array of `capacity` slots; each slot also holds its
+// canonical item and the sources seen for it. When full, the least recently
+// added or updated slot is overwritten and removed from its LSH buckets.
+export class DuplicateIndex<T> {
+  private readonly signatures: Uint32Array;
+  private readonly items: (T | undefined)[];
+  private readonly sources: string[][];
+  private readonly urls: (string | undefined)[];
+  private readonly buckets = new Map<string, number[]>();
+  private readonly byUrl = new Map<string, number>();
+  // Occupied slots, least recently used first.
+  private readonly recency = new Set<number>();
+
+  constructor(private readonly capacity: number) {
+    this.signatures = new Uint32Array(capacity * NUM_HASHES).fill(EMPTY);
+    this.items = new Array(capacity);
+    this.sources = new Array(capacity);
+    this.urls = new Array(capacity);
+  }
+
+  // Returns the slot of an indexed near-duplicate of batch[i], or -1. The
+  // slot can be reused by a later add(), so read it before adding more.
+  find(batch: Uint32Array, i: number, url?: string): number {
+    if (url && this.byUrl.has(url)) {
+      return this.byUrl.get(url);
+    }
+    if (batch[i * NUM_HASHES] === EMPTY) return -1;
+
+    for (let band = 0; band < BANDS; band++) {
+      const bucket = this.buckets.get(bandKey(batch, i, band));
+      if (!bucket) continue;
+      for (
+        let b = Math.max(0, bucket.length - MAX_BUCKET_SCAN);
+        b < bucket.length;
+        b++
+      ) {
+        const slot = bucket[b];
+        if (
+          similarity(this.signatures, slot, batch, i) >= SIMILARITY_THRESHOLD
+        ) {
+          return slot;
+        }
+      }
+    }
+    return -1;
+  }
+
+  item(slot: number): T {
+    return this.items[slot];
+  }
+
+  sourcesOf(slot: number): string[] {
+    return this.sources[slot];
+  }
+
+  addSources(slot: number, sources: string[]) {
+    this.sources[slot] = [...new Set([...this.sources[slot], ...sources])];
+    this.touch(slot);
+  }
+
+  replaceItem(slot: number, item: T) {
+    this.items[slot] = item;
+    this.touch(slot);
+  }
+
+  // Stores batch[i] as a new canonical item and returns its slot.
+  add(
+    batch: Uint32Array,
+    i: number,
+    url: string | undefined,
+    item: T,
+    sources: string[]
+  ): number {
+    let slot = this.recency.size;
+    if (slot === this.capacity) {
+      slot = this.recency.values().next().value;
+      this.evict(slot);
+    }
+    this.touch(slot);
+
+    this.signatures.set(
+      batch.subarray(i * NUM_HASHES, (i + 1) * NUM_HASHES),
+      slot * NUM_HASHES
+    );
+    this.items[slot] = item;
+    this.sources[slot] = [...new Set(sources)];
+    this.urls[slot] = url;
+    if (url) {
+      this.byUrl.set(url, slot);
+    }
+    if (this.signatures[slot * NUM_HASHES] === EMPTY) return slot;
+    for (let band = 0; band < BANDS; band++) {
+      const key = bandKey(this.signatures, slot, band);
+      const bucket = this.buckets.get(key);
+      if (bucket) {
+        bucket.push(slot);
+      } else {
+        this.buckets.set(key, [slot]);
+      }
+    }
+    return slot;
+  }
+
+  private touch(slot: number) {
+    this.recency.delete(slot);
+    this.recency.add(slot);
+  }
+
+  private evict(slot: number) {
+    const url = this.urls[slot];
+    if (url && this.byUrl.get(url) === slot) {
+      this.byUrl.delete(url);
+    }
+    if (this.signatures[slot * NUM_HASHES] !== EMPTY) {
+      for (let band = 0; band < BANDS; band++) {
+        const key = bandKey(this.signatures, slot, band);
+        const bucket = this.buckets.get(key).filter((member) => member !== slot);
+        if (bucket.length > 0) {
+          this.buckets.set(key, bucket);
+        } else {
+          this.buckets.delete(key);
+        }
+      }
+    }
+    this.signatures.fill(EMPTY, slot * NUM_HASHES, (slot + 1) * NUM_HASHES);
+    this.items[slot] = undefined;
+  }
+}
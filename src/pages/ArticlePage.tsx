@@ -2,8 +2,8 @@ import { useParams, useLocation } from "react-router-dom";
 import { useState, useEffect, useCallback } from "react";
 import {
   getArticleById,
-  getArticlesByCategory,
-  updateArticle,
+  getPendingCounterDelta,
+  incrementArticleCounter,
 } from "@/data/articles";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
@@ -43,43 +43,32 @@ const ArticlePage = () => {
   };
 
   useEffect(() => {
+    // Stored counts may not include changes still waiting to be flushed.
+    const setCounts = (source) => {
+      // Increments are queued under the route id, so read them back by it.
+      setLikes((source.likes || 0) + getPendingCounterDelta(articleId, "likes"));
+      setDislikes(
+        (source.dislikes || 0) + getPendingCounterDelta(articleId, "dislikes")
+      );
+      setViews((source.views || 0) + getPendingCounterDelta(articleId, "views"));
+    };
+
     const fetchArticle = async () => {
       if (!passedArticle && articleId) {
         setIsLoading(true);
 
-        let foundArticle = await getArticleById(articleId);
-
-        if (!foundArticle) {
-          const categories = [
-            "AI",
-            "ML",
-            "Blockchain",
-            "IoT",
-            "Quantum Computing",
-            "Robotics",
-            "VR/AR",
-            "Networking",
-          ];
-
-          for (const category of categories) {
-            const categoryArticles = await getArticlesByCategory(category);
-            foundArticle = categoryArticles.find((art) => art.id === articleId);
-            if (foundArticle) break;
-          }
-        }
+        // Served from the article cache when indexed, otherwise read from
+        // the database by id.
+        const foundArticle = await getArticleById(articleId);
 
         if (foundArticle) {
           setArticle(foundArticle);
-          setLikes(foundArticle.likes || 0);
-          setDislikes(foundArticle.dislikes || 0);
-          setViews(foundArticle.views || 0);
+          setCounts(foundArticle);
         }
 
         setIsLoading(false);
       } else if (passedArticle) {
-        setLikes(passedArticle.likes || 0);
-        setDislikes(passedArticle.dislikes || 0);
-        setViews(passedArticle.views || 0);
+        setCounts(passedArticle);
       }
     };
 
@@ -106,8 +95,7 @@ const ArticlePage = () => {
         );
 
         if (!viewedArticles[articleId]) {
-          const newViewCount = views + 1;
-          setViews(newViewCount);
+          setViews(views + 1);
           setViewCounted(true);
 
           viewedArticles[articleId] = true;
@@ -115,7 +103,7 @@ const ArticlePage = () => {
             "viewedArticles",
             JSON.stringify(viewedArticles)
           );
-          await updateArticle("views", newViewCount, articleId);
+          incrementArticleCounter(articleId, "views");
         }
       }
     };
@@ -141,11 +129,10 @@ const ArticlePage = () => {
     }
 
     if (hasDisliked) {
-      const newDislikeCount = Math.max(0, dislikes - 1);
-      setDislikes(newDislikeCount);
+      setDislikes(Math.max(0, dislikes - 1));
       setHasDisliked(false);
 
-      await updateArticle("dislikes", newDislikeCount, articleId);
+      incrementArticleCounter(articleId, "dislikes", -1);
 
       const dislikedArticles = JSON.parse(
         localStorage.getItem("dislikedArticles") || "{}"
@@ -157,11 +144,10 @@ const ArticlePage = () => {
       );
     }
 
-    const newLikeCount = likes + 1;
-    setLikes(newLikeCount);
+    setLikes(likes + 1);
     setHasLiked(true);
 
-    await updateArticle("likes", newLikeCount, articleId);
+    incrementArticleCounter(articleId, "likes");
 
     const likedArticles = JSON.parse(
       localStorage.getItem("likedArticles") || "{}"
@@ -187,11 +173,10 @@ const ArticlePage = () => {
     }
 
     if (hasLiked) {
-      const newLikeCount = Math.max(0, likes - 1);
-      setLikes(newLikeCount);
+      setLikes(Math.max(0, likes - 1));
       setHasLiked(false);
 
-      await updateArticle("likes", newLikeCount, articleId);
+      incrementArticleCounter(articleId, "likes", -1);
 
       const likedArticles = JSON.parse(
         localStorage.getItem("likedArticles") || "{}"
@@ -200,11 +185,10 @@ const ArticlePage = () => {
       localStorage.setItem("likedArticles", JSON.stringify(likedArticles));
     }
 
-    const newDislikeCount = dislikes + 1;
-    setDislikes(newDislikeCount);
+    setDislikes(dislikes + 1);
     setHasDisliked(true);
 
-    await updateArticle("dislikes", newDislikeCount, articleId);
+    incrementArticleCounter(articleId, "dislikes");
 
     const dislikedArticles = JSON.parse(
       localStorage.getItem("dislikedArticles") || "{}"
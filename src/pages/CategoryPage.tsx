@@ -1,5 +1,5 @@
 import { useParams } from "react-router-dom";
-import { useState, useEffect } from "react";
+import { useState, useEffect, useMemo } from "react";
 import { getArticlesByCategory } from "@/data/articles";
 import { getCategoryById } from "@/data/categories";
 import ArticleCard from "@/components/ArticleCard";
@@ -8,13 +8,14 @@ import { Article } from '@/data/articles';
 
 type SortOption = "az" | "za" | "newest" | "oldest";
 
+const titleCollator = new Intl.Collator();
+
 const CategoryPage = () => {
   const { categoryId } = useParams<{ categoryId: string }>();
   const [sortOption, setSortOption] = useState<SortOption>("newest");
   const [articles, setArticles] = useState<Article[]>([]);
   const [category, setCategory] = useState(getCategoryById(categoryId || ""));
   const [categoryArticles, setCategoryArticles] = useState<any[]>([]);
-  const [sortedArticles, setSortedArticles] = useState<any[]>([]);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
@@ -24,11 +25,8 @@ const CategoryPage = () => {
         setCategory(cat);
 
         if (cat) {
-          // Simulate network delay for demo purposes (remove in production)
-          await new Promise((resolve) => setTimeout(resolve, 1000));
           const articles = await getArticlesByCategory(cat.name);
           setCategoryArticles(articles);
-          setSortedArticles(articles);
           document.title = `${cat.name} Articles - TechDigest`;
         }
         setIsLoading(false);
@@ -38,32 +36,29 @@ const CategoryPage = () => {
     fetchData();
   }, [categoryId]);
 
-  useEffect(() => {
-    if (categoryArticles.length > 0) {
-      const articles = [...categoryArticles];
-
-      switch (sortOption) {
-        case "az":
-          articles.sort((a, b) => a.title.localeCompare(b.title));
-          break;
-        case "za":
-          articles.sort((a, b) => b.title.localeCompare(a.title));
-          break;
-        case "newest":
-          articles.sort(
-            (a, b) => new Date(b.date).getTime() - new Date(a.date).getTime()
-          );
-          break;
-        case "oldest":
-          articles.sort(
-            (a, b) => new Date(a.date).getTime() - new Date(b.date).getTime()
-          );
-          break;
-      }
+  // Sort keys are computed once per article and every ordering is built once
+  // per list, so switching tabs only picks an already sorted array.
+  const sortedOrders = useMemo(() => {
+    const keyed = categoryArticles.map((article) => ({
+      article,
+      time: new Date(article.date).getTime(),
+    }));
+    const byTitle = [...keyed]
+      .sort((a, b) => titleCollator.compare(a.article.title, b.article.title))
+      .map(({ article }) => article);
+    const byDate = keyed
+      .sort((a, b) => b.time - a.time)
+      .map(({ article }) => article);
+
+    return {
+      az: byTitle,
+      za: [...byTitle].reverse(),
+      newest: byDate,
+      oldest: [...byDate].reverse(),
+    };
+  }, [categoryArticles]);
 
-      setSortedArticles(articles);
-    }
-  }, [sortOption, categoryArticles]);
+  const sortedArticles = sortedOrders[sortOption];
 
   if (isLoading) {
     return (
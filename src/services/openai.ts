@@ -1,70 +1,266 @@
 import OpenAI from "openai";
+import { fnv1a } from "../lib/dedupe";
 
 const API_KEY = import.meta.env.VITE_OPENAI_API_KEY;
-if (!API_KEY) {
-  throw new Error("OpenAI API key is not configured");
-}
 
-const openai = new OpenAI({
-  apiKey: API_KEY,
-  dangerouslyAllowBrowser: true, //  should use a backend server in production
-});
+const MAX_INPUT_LENGTH = 2000;
+const MAX_CONCURRENT_SUMMARIES = 2;
+const MAX_RETRIES = 5;
+const SUMMARY_CACHE_PREFIX = "techdigest:summary:";
+const MAX_CACHED_SUMMARIES = 200;
+
+export type SummaryProvider = (text: string) => Promise<string>;
+
+let openai: OpenAI | undefined;
+
+const getOpenAI = (): OpenAI => {
+  if (!API_KEY) {
+    throw new Error("OpenAI API key is not configured");
+  }
+  if (!openai) {
+    openai = new OpenAI({
+      apiKey: API_KEY,
+      dangerouslyAllowBrowser: true, //  should use a backend server in production
+    });
+  }
+  return openai;
+};
+
+const openAIProvider: SummaryProvider = async (text) => {
+  console.log("Sending request to OpenAI...");
+
+  const response = await getOpenAI().chat.completions.create({
+    model: "gpt-3.5-turbo",
+    messages: [
+      {
+        role: "system",
+        content:
+          "You are a concise summarizer. Summarize the following article in 4-5 clear, informative sentences:",
+      },
+      {
+        role: "user",
+        content: text,
+      },
+    ],
+    temperature: 0.5,
+    max_tokens: 250,
+    presence_penalty: 0.1,
+    frequency_penalty: 0.1,
+  });
+
+  const summary = response.choices[0].message.content;
+
+  if (!summary) {
+    throw new Error("No summary generated");
+  }
+
+  console.log("Summary generated successfully");
+  return summary;
+};
+
+let provider: SummaryProvider = openAIProvider;
+// Bumped on every provider switch so results still in flight from the old
+// provider are not written into the new provider's cache.
+let providerGeneration = 0;
+
+// Swap the model behind summarizeText, e.g. for a local stand-in in tests.
+// Clears cached and in-flight summaries since they came from the previous
+// provider.
+export const setSummaryProvider = (next: SummaryProvider = openAIProvider) => {
+  provider = next;
+  providerGeneration++;
+  summaryCache.clear();
+  inFlightSummaries.clear();
+  for (const key of readStoredKeys()) {
+    removeStoredSummary(key);
+  }
+  writeStoredKeys([]);
+};
 
 const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 
-export const summarizeText = async (text: string): Promise<string> => {
-  const maxLength = 2000;
-  const inputText = text.length > maxLength ? text.slice(0, maxLength) : text;
+// Summaries are keyed by a hash of the (truncated) article text, kept in
+// memory and mirrored to localStorage so repeat views never reach the model.
+// Stored keys are tracked in recency order under SUMMARY_INDEX_KEY so storage
+// is trimmed to MAX_CACHED_SUMMARIES like the in-memory cache.
+const SUMMARY_INDEX_KEY = `${SUMMARY_CACHE_PREFIX}index`;
 
-  const makeRequest = async (tries = 0): Promise<string> => {
-    try {
-      console.log("Sending request to OpenAI...");
-
-      const response = await openai.chat.completions.create({
-        model: "gpt-3.5-turbo",
-        messages: [
-          {
-            role: "system",
-            content:
-              "You are a concise summarizer. Summarize the following article in 4-5 clear, informative sentences:",
-          },
-          {
-            role: "user",
-            content: inputText,
-          },
-        ],
-        temperature: 0.5,
-        max_tokens: 250,
-        presence_penalty: 0.1,
-        frequency_penalty: 0.1,
-      });
+const summaryCache = new Map<string, string>();
+const inFlightSummaries = new Map<string, Promise<string>>();
+const summaryStorage =
+  typeof window !== "undefined" ? window.localStorage : undefined;
+
+// Not a security boundary, so the synchronous FNV-1a hash is enough; the
+// length suffix makes accidental collisions even less likely.
+const hashText = (text: string): string =>
+  `${fnv1a(text).toString(16)}-${text.length.toString(16)}`;
+
+const readStoredKeys = (): string[] => {
+  try {
+    return JSON.parse(summaryStorage?.getItem(SUMMARY_INDEX_KEY) || "[]");
+  } catch (error) {
+    return [];
+  }
+};
+
+const writeStoredKeys = (keys: string[]) => {
+  try {
+    summaryStorage?.setItem(SUMMARY_INDEX_KEY, JSON.stringify(keys));
+  } catch (error) {
+    // Storage full or unavailable; the in-memory cache still works.
+  }
+};
 
-      const summary = response.choices[0].message.content;
+const removeStoredSummary = (key: string) => {
+  try {
+    summaryStorage?.removeItem(SUMMARY_CACHE_PREFIX + key);
+  } catch (error) {
+    // Ignore storage errors.
+  }
+};
 
-      if (!summary) {
-        throw new Error("No summary generated");
+// Drop stored summaries that the index does not track, such as entries
+// written before the index existed.
+const removeUntrackedSummaries = () => {
+  try {
+    const tracked = new Set(
+      readStoredKeys().map((key) => SUMMARY_CACHE_PREFIX + key)
+    );
+    tracked.add(SUMMARY_INDEX_KEY);
+    for (let i = summaryStorage.length - 1; i >= 0; i--) {
+      const key = summaryStorage.key(i);
+      if (key?.startsWith(SUMMARY_CACHE_PREFIX) && !tracked.has(key)) {
+        summaryStorage.removeItem(key);
       }
+    }
+  } catch (error) {
+    // Ignore storage errors.
+  }
+};
+
+if (summaryStorage) {
+  removeUntrackedSummaries();
+}
+
+const getCachedSummary = (key: string): string | undefined => {
+  const cached = summaryCache.get(key);
+  if (cached !== undefined) return cached;
+  try {
+    const stored = summaryStorage?.getItem(SUMMARY_CACHE_PREFIX + key);
+    if (stored) {
+      summaryCache.set(key, stored);
+      return stored;
+    }
+  } catch (error) {
+    // Storage unavailable; fall through to the provider.
+  }
+  return undefined;
+};
 
-      console.log("Summary generated successfully");
-      return summary;
+const setCachedSummary = (key: string, summary: string) => {
+  summaryCache.set(key, summary);
+  if (summaryCache.size > MAX_CACHED_SUMMARIES) {
+    summaryCache.delete(summaryCache.keys().next().value);
+  }
+  if (!summaryStorage) return;
+
+  const keys = readStoredKeys().filter((stored) => stored !== key);
+  keys.push(key);
+  while (keys.length > MAX_CACHED_SUMMARIES) {
+    removeStoredSummary(keys.shift());
+  }
+  try {
+    summaryStorage.setItem(SUMMARY_CACHE_PREFIX + key, summary);
+  } catch (error) {
+    // Storage full or unavailable; the in-memory cache still works.
+    keys.pop();
+  }
+  writeStoredKeys(keys);
+};
+
+// All summary requests share one concurrency cap and one rate-limit cooldown,
+// so a burst of readers backs off together instead of each retrying alone.
+let activeSummaries = 0;
+const waitingSummaries: Array<() => void> = [];
+let rateLimitedUntil = 0;
+
+const acquireSlot = async () => {
+  if (activeSummaries < MAX_CONCURRENT_SUMMARIES) {
+    activeSummaries++;
+    return;
+  }
+  await new Promise<void>((resolve) => waitingSummaries.push(resolve));
+};
+
+const releaseSlot = () => {
+  const next = waitingSummaries.shift();
+  if (next) {
+    next();
+  } else {
+    activeSummaries--;
+  }
+};
+
+const requestSummary = async (text: string): Promise<string> => {
+  for (let tries = 0; ; tries++) {
+    await acquireSlot();
+    try {
+      // Checked after getting a slot, so a request that inherits the slot of
+      // a rate-limited one still waits out the cooldown it just set.
+      for (
+        let wait = rateLimitedUntil - Date.now();
+        wait > 0;
+        wait = rateLimitedUntil - Date.now()
+      ) {
+        await sleep(wait);
+      }
+      return await provider(text);
     } catch (error: any) {
-      if (error.message && error.message.includes("Rate limit")) {
-        const maxRetries = 5;
-        if (tries < maxRetries) {
-          const delay = Math.pow(2, tries) * 1000;
-          console.warn(`Rate limit reached, retrying in ${delay} ms...`);
-          await sleep(delay);
-          return makeRequest(tries + 1);
-        } else {
-          throw new Error("Rate limit reached. Please try again later.");
-        }
+      if (!(error.message && error.message.includes("Rate limit"))) {
+        console.error("OpenAI API Error:", error);
+        throw new Error(`Summarization failed: ${error.message || error}`);
       }
-      console.error("OpenAI API Error:", error);
-      throw new Error(`Summarization failed: ${error.message || error}`);
+      if (tries >= MAX_RETRIES) {
+        throw new Error("Rate limit reached. Please try again later.");
+      }
+      const delay = Math.pow(2, tries) * 1000;
+      rateLimitedUntil = Math.max(rateLimitedUntil, Date.now() + delay);
+      console.warn(`Rate limit reached, retrying in ${delay} ms...`);
+    } finally {
+      releaseSlot();
     }
-  };
+  }
+};
+
+export const summarizeText = async (text: string): Promise<string> => {
+  const inputText =
+    text.length > MAX_INPUT_LENGTH ? text.slice(0, MAX_INPUT_LENGTH) : text;
+  const key = hashText(inputText);
+
+  const cached = getCachedSummary(key);
+  if (cached !== undefined) {
+    return cached;
+  }
 
-  return makeRequest();
+  let pending = inFlightSummaries.get(key);
+  if (!pending) {
+    const generation = providerGeneration;
+    const request = requestSummary(inputText)
+      .then((summary) => {
+        if (generation === providerGeneration) {
+          setCachedSummary(key, summary);
+        }
+        return summary;
+      })
+      .finally(() => {
+        if (inFlightSummaries.get(key) === request) {
+          inFlightSummaries.delete(key);
+        }
+      });
+    pending = request;
+    inFlightSummaries.set(key, pending);
+  }
+  return pending;
 };
 
 export const testOpenAIConnection = async (): Promise<boolean> => {
@@ -0,0 +1,114 @@
+import { performance } from 'node:perf_hooks';
+import { DuplicateIndex, clusterDuplicates, computeSignatures } from '../lib/dedupe';
+
+// Synthetic feed: ARTICLES articles in BATCH_SIZE batches, where roughly
+// DUPLICATE_RATE of them are syndicated copies of an earlier story with a
+// different headline prefix and a few words changed.
+const ARTICLES = 100_000;
+const BATCH_SIZE = 100;
+const INDEX_CAPACITY = 2000;
+const DUPLICATE_RATE = 0.3;
+const VOCABULARY = 5000;
+
+interface BenchmarkArticle {
+    title: string;
+    body: string;
+    url: string;
+    story: number;
+}
+
+// mulberry32, so every run sees the same feed.
+const random = (() => {
+    let seed = 0x2f6b1a3d;
+    return () => {
+        seed = (seed + 0x6d2b79f5) | 0;
+        let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+        t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+})();
+
+const words = (count: number) =>
+    Array.from({ length: count }, () => `w${Math.floor(random() * VOCABULARY)}`);
+
+function generateFeed(): BenchmarkArticle[] {
+    const feed: BenchmarkArticle[] = [];
+    for (let i = 0; i < ARTICLES; i++) {
+        // Copies come from recent stories, as syndication happens within hours.
+        if (i > 0 && random() < DUPLICATE_RATE) {
+            const original = feed[Math.max(0, i - 1 - Math.floor(random() * 500))];
+            const body = original.body.split(' ');
+            for (let k = 0; k < 2; k++) {
+                body[Math.floor(random() * body.length)] = words(1)[0];
+            }
+            feed.push({
+                title: original.title,
+                body: body.join(' '),
+                url: `https://copy.example.com/${i}`,
+                story: original.story,
+            });
+        } else {
+            feed.push({
+                title: words(8).join(' '),
+                body: words(70).join(' '),
+                url: `https://news.example.com/${i}`,
+                story: i,
+            });
+        }
+    }
+    return feed;
+}
+
+function report(name: string, ms: number, merged: number, wrong: number) {
+    console.log(
+        `${name}: ${ms.toFixed(0)} ms, ${Math.round(ARTICLES / (ms / 1000))} articles/s, ` +
+        `${merged} merged, ${wrong} merged into the wrong story`
+    );
+}
+
+function runBenchmark() {
+    const feed = generateFeed();
+    const copies = feed.filter((article, i) => article.story !== i).length;
+    console.log(`${ARTICLES} articles, ${copies} syndicated copies`);
+
+    let start = performance.now();
+    let merged = 0;
+    let wrong = 0;
+    for (let offset = 0; offset < ARTICLES; offset += BATCH_SIZE) {
+        const batch = feed.slice(offset, offset + BATCH_SIZE);
+        for (const [first, ...rest] of clusterDuplicates(batch)) {
+            merged += rest.length;
+            wrong += rest.filter((i) => batch[i].story !== batch[first].story).length;
+        }
+    }
+    report('clusterDuplicates per batch', performance.now() - start, merged, wrong);
+
+    // Mirrors dedupeAndUpsert: cluster each batch, then match the canonical
+    // articles against everything indexed by earlier batches.
+    const index = new DuplicateIndex<number>(INDEX_CAPACITY);
+    start = performance.now();
+    merged = 0;
+    wrong = 0;
+    for (let offset = 0; offset < ARTICLES; offset += BATCH_SIZE) {
+        const batch = feed.slice(offset, offset + BATCH_SIZE);
+        const clusters = clusterDuplicates(batch);
+        const canonical = clusters.map(([first]) => batch[first]);
+        const signatures = computeSignatures(canonical);
+        const slots = canonical.map((article, i) => index.find(signatures, i, article.url));
+        clusters.forEach((cluster, i) => {
+            const story = canonical[i].story;
+            merged += cluster.length - 1;
+            wrong += cluster.filter((member) => batch[member].story !== story).length;
+            if (slots[i] === -1) {
+                index.add(signatures, i, canonical[i].url, story, []);
+            } else {
+                merged++;
+                if (index.item(slots[i]) !== story) wrong++;
+                index.addSources(slots[i], []);
+            }
+        });
+    }
+    report('clusterDuplicates + DuplicateIndex', performance.now() - start, merged, wrong);
+}
+
+runBenchmark();
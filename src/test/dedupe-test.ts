@@ -0,0 +1,81 @@
+import assert from 'node:assert/strict';
+import { DuplicateIndex, clusterDuplicates, computeSignatures } from '../lib/dedupe';
+
+const STORIES: Record<string, string> = {
+    Acme: 'Acme unveils a battery that charges electric cars in ten minutes using a new solid electrolyte developed with university partners.',
+    Globex: 'Globex will cut prices on its cloud storage plans after a quarter of slow growth and rising competition from smaller rivals.',
+    Initech: 'Initech engineers patched a flaw in printer firmware that let attackers read documents queued on office networks.',
+};
+
+// Syndicated copies share the text and differ only in attribution.
+const story = (company: string, source = 'wire') => ({
+    title: `${company} news from ${source}`,
+    body: STORIES[company],
+});
+
+const tests: Array<[string, () => void]> = [
+    ['clusterDuplicates merges articles with the same URL', () => {
+        const articles = [
+            { title: 'One story', url: 'https://example.com/a' },
+            { title: 'A different headline', url: 'https://example.com/a' },
+            { title: 'Unrelated', url: 'https://example.com/b' },
+        ];
+        assert.deepEqual(clusterDuplicates(articles), [[0, 1], [2]]);
+    }],
+    ['clusterDuplicates merges near-duplicate text', () => {
+        const articles = [story('Acme'), story('Globex'), story('Acme', 'agency')];
+        assert.deepEqual(clusterDuplicates(articles), [[0, 2], [1]]);
+    }],
+    ['clusterDuplicates keeps articles without text apart', () => {
+        assert.deepEqual(clusterDuplicates([{}, { title: '' }, {}]), [[0], [1], [2]]);
+    }],
+    ['DuplicateIndex finds stored articles by URL and by text', () => {
+        const index = new DuplicateIndex<string>(4);
+        const stored = computeSignatures([story('Acme')]);
+        const slot = index.add(stored, 0, 'https://example.com/acme', 'acme', ['A']);
+
+        const batch = computeSignatures([{}, story('Acme', 'agency'), story('Globex')]);
+        assert.equal(index.find(batch, 0, 'https://example.com/acme'), slot);
+        assert.equal(index.find(batch, 1), slot);
+        assert.equal(index.find(batch, 2), -1);
+        assert.equal(index.find(batch, 0), -1);
+    }],
+    ['DuplicateIndex merges sources without repeats', () => {
+        const index = new DuplicateIndex<string>(4);
+        const slot = index.add(computeSignatures([story('Acme')]), 0, undefined, 'acme', ['A', 'A']);
+        index.addSources(slot, ['B', 'A']);
+        assert.deepEqual(index.sourcesOf(slot), ['A', 'B']);
+    }],
+    ['DuplicateIndex evicts the least recently updated slot', () => {
+        const index = new DuplicateIndex<string>(2);
+        const batch = computeSignatures([story('Acme'), story('Globex'), story('Initech')]);
+        const acme = index.add(batch, 0, 'acme', 'acme', []);
+        index.add(batch, 1, 'globex', 'globex', []);
+        index.replaceItem(acme, 'acme v2');
+        index.add(batch, 2, 'initech', 'initech', []);
+
+        assert.equal(index.item(index.find(batch, 0, 'acme')), 'acme v2');
+        assert.equal(index.find(batch, 1, 'globex'), -1);
+        assert.equal(index.find(batch, 1), -1);
+        assert.equal(index.item(index.find(batch, 2)), 'initech');
+    }],
+];
+
+function runTests() {
+    let failed = 0;
+    for (const [name, test] of tests) {
+        try {
+            test();
+            console.log(`✅ ${name}`);
+        } catch (error) {
+            failed++;
+            console.error(`❌ ${name}`, error);
+        }
+    }
+    console.log(`${tests.length - failed}/${tests.length} passed`);
+    if (failed > 0) {
+        process.exitCode = 1;
+    }
+}
+
+runTests();
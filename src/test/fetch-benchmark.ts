@@ -0,0 +1,152 @@
+import http from 'node:http';
+import { AddressInfo } from 'node:net';
+import { performance } from 'node:perf_hooks';
+
+// Replays article responses from a local server and measures the article
+// client end to end: HTTP fetch, JSON parse, dedupe and upsert on a cache
+// miss, and the in-memory cache on a hit.
+//
+// The responses are generated once per category in the shape the article API
+// returns, then replayed unchanged for every request. Supabase calls are
+// redirected to the same server, which keeps rows in memory, so nothing is
+// written to the real project.
+const CATEGORIES = ['AI', 'ML', 'Blockchain', 'IoT', 'Quantum Computing', 'Robotics', 'VR/AR', 'Networking'];
+const ARTICLES_PER_RESPONSE = 100;
+const SERVER_DELAY_MS = 20;
+const COLD_ROUNDS = 4;
+const CACHED_REQUESTS = 10_000;
+
+interface RecordedArticle {
+    id: string;
+    title: string;
+    body: string;
+    url: string;
+    source: string;
+    category: string;
+    image: string;
+    date: string;
+}
+
+function recordResponse(category: string): string {
+    const articles: RecordedArticle[] = [];
+    for (let i = 0; i < ARTICLES_PER_RESPONSE; i++) {
+        articles.push({
+            id: `${category}-${i}`,
+            title: `${category} update ${i}: ${'lorem ipsum dolor '.repeat(3)}`,
+            body: `${category} story ${i}. `.repeat(80),
+            url: `https://news.example.com/${encodeURIComponent(category)}/${i}`,
+            source: `Source ${i % 7}`,
+            category,
+            image: `https://images.example.com/${i}.jpg`,
+            date: new Date(Date.UTC(2026, 0, 1 + (i % 28))).toISOString(),
+        });
+    }
+    return JSON.stringify(articles);
+}
+
+const responses = new Map(CATEGORIES.map((category) => [category, recordResponse(category)]));
+const rows = new Map<string, Record<string, unknown>>();
+
+const readBody = (request: http.IncomingMessage): Promise<string> =>
+    new Promise((resolve) => {
+        let body = '';
+        request.on('data', (chunk) => (body += chunk));
+        request.on('end', () => resolve(body));
+    });
+
+const send = (response: http.ServerResponse, status: number, body: string) => {
+    response.writeHead(status, {
+        'content-type': 'application/json',
+        'content-length': Buffer.byteLength(body),
+    });
+    response.end(body);
+};
+
+// Serves /api/articles/<category>[/<round>] from the recorded responses, and
+// just enough of the Supabase REST API for upserts and `in` selects.
+const server = http.createServer(async (request, response) => {
+    const url = new URL(request.url, 'http://localhost');
+    if (url.pathname.startsWith('/rest/v1/articles')) {
+        if (request.method === 'POST') {
+            const upserted = JSON.parse(await readBody(request)).map((article) => {
+                const row = { views: 0, likes: 0, dislikes: 0, ...rows.get(String(article.id)), ...article };
+                rows.set(String(row.id), row);
+                return row;
+            });
+            send(response, 201, JSON.stringify(upserted));
+        } else {
+            const ids = (url.searchParams.get('id') || '')
+                .replace(/^in\.\(|\)$/g, '')
+                .split(',')
+                .map((id) => id.replace(/^"|"$/g, ''));
+            send(response, 200, JSON.stringify(ids.filter((id) => rows.has(id)).map((id) => rows.get(id))));
+        }
+        return;
+    }
+
+    const [, , , category] = url.pathname.split('/').map(decodeURIComponent);
+    setTimeout(() => {
+        if (responses.has(category)) {
+            send(response, 200, responses.get(category));
+        } else {
+            send(response, 404, '{"error":"unknown category"}');
+        }
+    }, SERVER_DELAY_MS);
+});
+
+function summarize(name: string, latencies: number[], elapsedMs: number) {
+    const sorted = [...latencies].sort((a, b) => a - b);
+    const at = (p: number) => sorted[Math.min(sorted.length - 1, Math.floor((sorted.length * p) / 100))];
+    console.log(
+        `${name}: ${latencies.length} requests, p50 ${at(50).toFixed(2)} ms, p99 ${at(99).toFixed(2)} ms, ` +
+        `${Math.round(latencies.length / (elapsedMs / 1000))} requests/s`
+    );
+}
+
+async function runBenchmark() {
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    const replayUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+
+    // The Supabase client resolves fetch when it is created, so patch it
+    // before the article module (and with it the client) is loaded.
+    const realFetch = globalThis.fetch;
+    globalThis.fetch = (input, init) => {
+        const url = new URL(input instanceof Request ? input.url : input.toString());
+        return realFetch(`${replayUrl}${url.pathname}${url.search}`, init);
+    };
+    const { fetchArticlesByCat, formatMetrics, setArticlesApiUrl } = await import('../data/newsArticles');
+    setArticlesApiUrl(replayUrl);
+
+    // Every round uses new paths, so each request misses the cache and goes
+    // through fetch, parse, dedupe and upsert. Later rounds replay the same
+    // articles, which exercises the unchanged-row skip.
+    const cold: number[] = [];
+    let start = performance.now();
+    for (let round = 0; round < COLD_ROUNDS; round++) {
+        await Promise.all(CATEGORIES.map(async (category) => {
+            const requestStart = performance.now();
+            const articles = await fetchArticlesByCat(`${encodeURIComponent(category)}/${round}`);
+            if (articles.length === 0) throw new Error(`No articles for ${category}`);
+            cold.push(performance.now() - requestStart);
+        }));
+    }
+    summarize('cache miss', cold, performance.now() - start);
+
+    const cached: number[] = [];
+    start = performance.now();
+    for (let i = 0; i < CACHED_REQUESTS; i++) {
+        const requestStart = performance.now();
+        await fetchArticlesByCat(`${encodeURIComponent(CATEGORIES[i % CATEGORIES.length])}/${COLD_ROUNDS - 1}`);
+        cached.push(performance.now() - requestStart);
+    }
+    summarize('cache hit', cached, performance.now() - start);
+
+    console.log('\n' + formatMetrics());
+    server.close();
+}
+
+runBenchmark().catch((error) => {
+    console.error('Benchmark failed:', error);
+    server.close();
+    process.exitCode = 1;
+});